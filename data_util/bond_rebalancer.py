@@ -1,8 +1,19 @@
+import json
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field, validator, root_validator
-from typing import List, Dict, Literal, Optional
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    parse_obj_as,
+    validator,
+    root_validator,
+)
+from typing import List, Dict, Iterator, Literal, Optional
+from dataclasses import dataclass
 from datetime import date, datetime
+from operator import itemgetter, methodcaller
 import numpy as np
 from enum import Enum
 
@@ -99,12 +110,15 @@ class BondAsset(BaseModel):
         return self.coupon_rate * self.face_value / self.current_price
 
 
-class RebalanceBondPayload(BaseModel):
+class RebalanceRequest(BaseModel):
     portfolio_id: str = Field(..., example="user123")
     total_value: float = Field(None)
     strategy: RebalanceStrategy = Field(default=RebalanceStrategy.DURATION_TARGET)
     target_duration: Optional[float] = Field(None, ge=0, example=5.0)
     target_yield: Optional[float] = Field(None, ge=0, lt=1, example=0.04)
+
+
+class RebalanceBondPayload(RebalanceRequest):
     bonds: List[BondAsset]
 
     @root_validator(pre=True)
@@ -141,7 +155,7 @@ class TradeAction(BaseModel):
     expected_duration: float
 
 
-class RebalanceResult(BaseModel):
+class RebalanceSummary(BaseModel):
     portfolio_id: str
     total_value: float
     strategy_used: RebalanceStrategy
@@ -152,6 +166,9 @@ class RebalanceResult(BaseModel):
     expected_portfolio_duration: float
     current_portfolio_yield: float
     expected_portfolio_yield: float
+
+
+class RebalanceResult(RebalanceSummary):
     rebalancing_actions: List[TradeAction]
 
 
@@ -225,12 +242,11 @@ def calculate_target_weights_laddered(bonds: List[BondAsset]) -> Dict[int, float
     return weights
 
 
-def calculate_trades(payload: RebalanceBondPayload) -> List[TradeAction]:
-    """Calculate optimal trades based on the selected strategy"""
+def assign_target_weights(payload: RebalanceBondPayload) -> None:
+    """Calculate target weights based on the selected strategy and
+    write them onto the bond objects in the payload"""
     bonds = payload.bonds
-    total_value = payload.total_value
 
-    # Step 1: Calculate target weights based on strategy
     if payload.strategy == RebalanceStrategy.EQUAL_WEIGHT:
         target_weights = {bond.bond_id: 1.0 / len(bonds) for bond in bonds}
 
@@ -249,14 +265,54 @@ def calculate_trades(payload: RebalanceBondPayload) -> List[TradeAction]:
     elif payload.strategy == RebalanceStrategy.LADDERED:
         target_weights = calculate_target_weights_laddered(bonds)
 
-    # Step 2: Update target weights in the bond objects
     for bond in bonds:
         bond.target_weight = target_weights.get(bond.bond_id, 0)
 
-    # Step 3: Calculate trades needed
-    trades = []
 
-    for bond in bonds:
+def summarize_rebalance(
+    payload: RebalanceBondPayload, durations: List[float]
+) -> RebalanceSummary:
+    """Calculate portfolio level metrics once target weights are assigned"""
+    bonds = payload.bonds
+
+    current_duration = sum(
+        bond.current_weight * duration for bond, duration in zip(bonds, durations)
+    )
+    expected_duration = sum(
+        bond.target_weight * duration for bond, duration in zip(bonds, durations)
+    )
+    current_yield = sum(bond.current_weight * bond.yield_to_maturity for bond in bonds)
+    expected_yield = sum(bond.target_weight * bond.yield_to_maturity for bond in bonds)
+
+    # Same rule as iter_trades: a bond is only traded when its delta is nonzero
+    total_value = payload.total_value
+    total_trades = sum(
+        1
+        for bond in bonds
+        if bond.target_weight * total_value - bond.current_weight * total_value != 0
+    )
+
+    return RebalanceSummary(
+        portfolio_id=payload.portfolio_id,
+        total_value=payload.total_value,
+        strategy_used=payload.strategy,
+        total_trades=total_trades,
+        target_duration=payload.target_duration,
+        target_yield=payload.target_yield,
+        current_portfolio_duration=current_duration,
+        expected_portfolio_duration=expected_duration,
+        current_portfolio_yield=current_yield,
+        expected_portfolio_yield=expected_yield,
+    )
+
+
+def iter_trades(
+    payload: RebalanceBondPayload, durations: List[float]
+) -> Iterator[TradeAction]:
+    """Lazily yield the trade needed for each bond in the payload"""
+    total_value = payload.total_value
+
+    for bond, duration in zip(payload.bonds, durations):
         current_amount = bond.current_weight * total_value
         target_amount = bond.target_weight * total_value
         delta = target_amount - current_amount
@@ -268,48 +324,566 @@ def calculate_trades(payload: RebalanceBondPayload) -> List[TradeAction]:
             action = "buy"
         elif delta < 0:
             action = "sell"
+        else:
+            action = "hold"
+
+        yield TradeAction(
+            bond_id=bond.bond_id,
+            symbol=bond.symbol,
+            name=bond.name,
+            action=action,
+            quantity=quantity_to_trade,
+            amount=abs(delta),
+            current_weight=bond.current_weight,
+            target_weight=bond.target_weight,
+            expected_yield=bond.yield_to_maturity,
+            expected_duration=duration,
+        )
+
 
-        trades.append(
-            TradeAction(
-                bond_id=bond.bond_id,
-                symbol=bond.symbol,
-                name=bond.name,
-                action=action,
-                quantity=quantity_to_trade,
-                amount=abs(delta),
-                current_weight=bond.current_weight,
-                target_weight=bond.target_weight,
-                expected_yield=bond.yield_to_maturity,
-                expected_duration=bond.duration,
+def calculate_trades(payload: RebalanceBondPayload) -> RebalanceResult:
+    """Calculate optimal trades based on the selected strategy"""
+    assign_target_weights(payload)
+
+    # Duration is an O(periods) property, compute it once per bond
+    durations = [bond.duration for bond in payload.bonds]
+    summary = summarize_rebalance(payload, durations)
+
+    return RebalanceResult(
+        **summary.dict(),
+        rebalancing_actions=list(iter_trades(payload, durations)),
+    )
+
+
+def stream_trades(
+    payload: RebalanceBondPayload, chunk_size: int = 500
+) -> Iterator[str]:
+    """Calculate trades and yield them as NDJSON records.
+
+    The first line is a header record carrying the portfolio metrics,
+    followed by the trades in chunks of at most `chunk_size` so clients
+    can start acting on them while the rest is still being computed.
+
+    Args:
+        payload (RebalanceBondPayload): portfolio to rebalance
+        chunk_size (int, optional): max trades per record. Defaults to 500.
+
+    Returns:
+        Iterator[str]: newline terminated JSON records
+    """
+    # Weights and metrics are computed eagerly so that strategy errors
+    # surface as a normal HTTP error before the first byte is sent
+    assign_target_weights(payload)
+    durations = [bond.duration for bond in payload.bonds]
+    summary = summarize_rebalance(payload, durations)
+
+    trades = (trade.dict() for trade in iter_trades(payload, durations))
+    return _stream_records(summary, trades, chunk_size)
+
+
+def _stream_records(
+    summary: RebalanceSummary, trades: Iterator[dict], chunk_size: int
+) -> Iterator[str]:
+    # NaN and Infinity are not valid JSON, fail loudly instead of emitting them
+    yield json.dumps({"type": "header", **summary.dict()}, allow_nan=False) + "\n"
+
+    chunk = []
+    for trade in trades:
+        chunk.append(trade)
+        if len(chunk) >= chunk_size:
+            yield _trades_record(chunk)
+            chunk = []
+    if chunk:
+        yield _trades_record(chunk)
+
+
+def _trades_record(chunk: List[dict]) -> str:
+    record = {"type": "trades", "rebalancing_actions": chunk}
+    return json.dumps(record, allow_nan=False) + "\n"
+
+
+# Columnar ingestion: decodes the bonds array straight into NumPy columns
+# in a single pass and applies the BondAsset field constraints as
+# vectorized checks, skipping the per-bond pydantic models entirely.
+
+_BOND_FIELDS = (
+    "bond_id",
+    "symbol",
+    "name",
+    "current_weight",
+    "quantity",
+    "face_value",
+    "coupon_rate",
+    "coupon_frequency",
+    "current_price",
+    "maturity_date",
+    "issue_date",
+    "yield_to_maturity",
+)
+_INT_FIELDS = ("bond_id", "quantity", "coupon_frequency")
+_FLOAT_FIELDS = (
+    "current_weight",
+    "face_value",
+    "coupon_rate",
+    "current_price",
+    "yield_to_maturity",
+)
+_STR_FIELDS = ("symbol", "name")
+_DATE_FIELDS = ("maturity_date", "issue_date")
+
+# Mirrors the Field constraints on BondAsset
+_BOND_COLUMN_CHECKS = (
+    ("current_weight", lambda x: (x >= 0) & (x <= 1), "must be >= 0 and <= 1"),
+    ("target_weight", lambda x: (x >= 0) & (x <= 1), "must be >= 0 and <= 1"),
+    ("quantity", lambda x: x >= 0, "must be >= 0"),
+    ("face_value", lambda x: x > 0, "must be > 0"),
+    ("coupon_rate", lambda x: (x >= 0) & (x < 1), "must be >= 0 and < 1"),
+    ("coupon_frequency", lambda x: (x >= 1) & (x <= 12), "must be >= 1 and <= 12"),
+    ("current_price", lambda x: x > 0, "must be > 0"),
+    ("yield_to_maturity", lambda x: (x >= 0) & (x < 1), "must be >= 0 and < 1"),
+)
+
+# Cap the number of row errors reported for very large payloads
+_MAX_COLUMN_ERRORS = 100
+
+
+# Below this 1 - v, the closed form duration annuity loses more than ~1e-11
+# relative precision to cancellation
+_DIRECT_SUM_THRESHOLD = 1e-3
+
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _weighted_annuity_direct(
+    discount_rate: np.ndarray, periods: np.ndarray
+) -> np.ndarray:
+    """sum(t / (1 + r)^t) for t = 1..periods, one period at a time"""
+    total = np.zeros_like(discount_rate)
+    for t in range(1, int(periods.max(initial=0)) + 1):
+        total += np.where(t <= periods, t / (1 + discount_rate) ** t, 0.0)
+    return total
+
+
+@dataclass
+class BondColumns:
+    bond_id: np.ndarray
+    symbol: List[str]
+    name: List[str]
+    current_weight: np.ndarray
+    quantity: np.ndarray
+    face_value: np.ndarray
+    coupon_rate: np.ndarray
+    coupon_frequency: np.ndarray
+    current_price: np.ndarray
+    maturity_date: np.ndarray
+    issue_date: np.ndarray
+    yield_to_maturity: np.ndarray
+    target_weight: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.bond_id)
+
+    @property
+    def duration(self) -> np.ndarray:
+        """Vectorized Macaulay duration, matching BondAsset.duration
+
+        Returns:
+            np.ndarray: Macaulay duration in floating point years
+        """
+        today = np.datetime64(datetime.now().date(), "D")
+        days = (self.maturity_date - today).astype(np.float64)
+        years_to_maturity = np.maximum(days / 365, 0)
+
+        ytm = np.where(self.yield_to_maturity <= 0, 0.01, self.yield_to_maturity)
+        frequency = self.coupon_frequency.astype(np.float64)
+
+        coupon_payment = self.face_value * self.coupon_rate / frequency
+        periods = np.floor(years_to_maturity * frequency)
+        discount_rate = ytm / frequency
+
+        # Closed form of sum(t * v^t) for t = 1..periods
+        v = 1 / (1 + discount_rate)
+        one_minus_v = discount_rate / (1 + discount_rate)
+        v_n = v**periods
+        weighted_annuity = (
+            v * (1 - (periods + 1) * v_n + periods * v_n * v) / one_minus_v**2
+        )
+
+        # The closed form cancels catastrophically as v approaches 1, so
+        # sum those bonds' cash flows directly like BondAsset.duration does
+        direct = one_minus_v < _DIRECT_SUM_THRESHOLD
+        if direct.any():
+            weighted_annuity[direct] = _weighted_annuity_direct(
+                discount_rate[direct], periods[direct]
             )
+
+        weighted_pv_sum = coupon_payment * weighted_annuity / frequency
+        weighted_pv_sum += self.face_value * v_n * years_to_maturity
+
+        return np.where(
+            years_to_maturity > 0, weighted_pv_sum / self.current_price, 0.0
         )
 
-    # Calculate portfolio metrics
-    current_duration = sum(bond.current_weight * bond.duration for bond in bonds)
-    expected_duration = sum(bond.target_weight * bond.duration for bond in bonds)
-    current_yield = sum(bond.current_weight * bond.yield_to_maturity for bond in bonds)
-    expected_yield = sum(bond.target_weight * bond.yield_to_maturity for bond in bonds)
 
-    # Filter to only actual trades
-    active_trades = [t for t in trades if t.action != "hold"]
+def _column_error(row: Optional[int], field: str, msg: str) -> dict:
+    loc = ["body", "bonds"] if row is None else ["body", "bonds", row, field]
+    return {"loc": loc, "msg": msg, "type": "value_error"}
 
-    return RebalanceResult(
-        portfolio_id=payload.portfolio_id,
+
+def _converts_to_scalar(value, dtype) -> bool:
+    if np.ndim(value) != 0:
+        return False
+    try:
+        np.asarray(value, dtype=dtype)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _to_array(values: list, dtype, field: str, errors: List[dict]) -> np.ndarray:
+    """Convert a raw column to a typed array, locating the bad rows on failure"""
+    try:
+        array = np.asarray(values, dtype=dtype)
+        # Nested values such as [1] cast cleanly but give a 2-d array
+        if array.ndim == 1:
+            return array
+    except (TypeError, ValueError):
+        pass
+
+    msg = "must be a number"
+    bad = [
+        row for row, value in enumerate(values) if not _converts_to_scalar(value, dtype)
+    ]
+    if bad:
+        errors.extend(_column_error(row, field, msg) for row in bad)
+    else:
+        errors.append(_column_error(None, field, f"{field} {msg}"))
+    return np.zeros(len(values), dtype=dtype)
+
+
+def _to_int_array(values: list, field: str, errors: List[dict]) -> np.ndarray:
+    """Convert a raw column to int64 without a lossy round trip through float"""
+    if not set(map(type, values)) - {int}:
+        try:
+            return np.asarray(values, dtype=np.int64)
+        except OverflowError:
+            pass
+
+    # Slow path: coerce the odd values (10.0, "12", True) the way BondAsset
+    # would and reject anything outside the int64 range
+    parsed = []
+    for row, value in enumerate(values):
+        if type(value) is not int:
+            try:
+                value = parse_obj_as(int, value)
+            except ValidationError:
+                errors.append(_column_error(row, field, "must be an integer"))
+                value = 0
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            errors.append(_column_error(row, field, "must fit in a 64-bit integer"))
+            value = 0
+        parsed.append(value)
+    return np.asarray(parsed, dtype=np.int64)
+
+
+def _to_date_array(values: list, field: str, errors: List[dict]) -> np.ndarray:
+    """Convert a raw column of dates to a datetime64 array"""
+    # Fast path: a column of plain YYYY-MM-DD strings casts straight through
+    if not (set(map(type, values)) - {str} or set(map(len, values)) - {10}):
+        try:
+            array = np.asarray(values, dtype="datetime64[D]")
+            if not np.isnat(array).any():
+                return array
+        except ValueError:
+            pass
+
+    # Slow path: NumPy disagrees with BondAsset's date fields both ways, it
+    # casts "2031" and None but rejects "2035-12-31T00:00:00", so let
+    # pydantic decide every value that is not plain YYYY-MM-DD
+    parsed = []
+    for row, value in enumerate(values):
+        try:
+            if type(value) is str and len(value) == 10 and value[4::3] == "--":
+                parsed.append(date.fromisoformat(value))
+            else:
+                parsed.append(parse_obj_as(date, value))
+        except (ValidationError, ValueError):
+            errors.append(_column_error(row, field, "must be a valid date"))
+            parsed.append(date(1970, 1, 1))
+    return np.array(parsed, dtype="datetime64[D]")
+
+
+def _locate_bad_rows(bonds: list) -> tuple:
+    """Slow path of the column decode, only taken when some bond is malformed"""
+    getter = itemgetter(*_BOND_FIELDS)
+    rows = []
+    target_weights = []
+    errors = []
+
+    for row, bond in enumerate(bonds):
+        if not isinstance(bond, dict):
+            errors.append(_column_error(row, "bond", "must be an object"))
+        elif not all(field in bond for field in _BOND_FIELDS):
+            errors.extend(
+                _column_error(row, field, "field required")
+                for field in _BOND_FIELDS
+                if field not in bond
+            )
+        else:
+            rows.append(getter(bond))
+            target_weights.append(bond.get("target_weight"))
+            continue
+        # Keep the columns aligned with the input rows
+        rows.append((0, "", "", 0, 0, 1, 0, 1, 1, "1970-01-01", "1970-01-01", 0))
+        target_weights.append(None)
+
+    raw = dict(zip(_BOND_FIELDS, map(list, zip(*rows))))
+    return raw, target_weights, errors
+
+
+def parse_bond_columns(bonds: list) -> BondColumns:
+    """Decode the raw bonds array into typed columns without building
+    per-bond models.
+
+    Applies the same field constraints as BondAsset as vectorized checks.
+
+    Args:
+        bonds (list): raw bond objects from the request body
+
+    Raises:
+        HTTPException: 422 with row indexed errors if any bond is invalid
+
+    Returns:
+        BondColumns: typed columns, one entry per bond
+    """
+    if not isinstance(bonds, list):
+        raise HTTPException(
+            status_code=422,
+            detail=[_column_error(None, "bonds", "bonds must be a list")],
+        )
+
+    # Each column is pulled out by a C level map over the raw dicts, which
+    # is much cheaper than building and transposing per-row tuples
+    try:
+        raw = {field: list(map(itemgetter(field), bonds)) for field in _BOND_FIELDS}
+        target_weights = list(map(methodcaller("get", "target_weight"), bonds))
+        errors = []
+    except (AttributeError, KeyError, TypeError):
+        raw, target_weights, errors = _locate_bad_rows(bonds)
+
+    columns = {}
+
+    for field in _FLOAT_FIELDS:
+        columns[field] = _to_array(raw[field], np.float64, field, errors)
+
+    for field in _INT_FIELDS:
+        columns[field] = _to_int_array(raw[field], field, errors)
+
+    for field in _STR_FIELDS:
+        values = raw[field]
+        if set(map(type, values)) - {str}:
+            errors.extend(
+                _column_error(row, field, "must be a string")
+                for row, value in enumerate(values)
+                if type(value) is not str
+            )
+        columns[field] = values
+
+    for field in _DATE_FIELDS:
+        columns[field] = _to_date_array(raw[field], field, errors)
+
+    if target_weights.count(None) != len(target_weights):
+        columns["target_weight"] = _to_array(
+            [np.nan if w is None else w for w in target_weights],
+            np.float64,
+            "target_weight",
+            errors,
+        )
+
+    for field, check, msg in _BOND_COLUMN_CHECKS:
+        if field not in columns:
+            continue
+        values = columns[field]
+        valid = check(values)
+        if field == "target_weight":
+            valid |= np.isnan(values)
+        errors.extend(
+            _column_error(int(row), field, msg) for row in np.flatnonzero(~valid)
+        )
+
+    if errors:
+        raise HTTPException(status_code=422, detail=errors[:_MAX_COLUMN_ERRORS])
+
+    current_total = columns["current_weight"].sum()
+    # Allow a small margin for floating point arithmetic
+    if not (0.99 < current_total < 1.01):
+        raise HTTPException(
+            status_code=422,
+            detail=[
+                _column_error(
+                    None,
+                    "bonds",
+                    f"Sum of current weights must be approximately 1 (got {current_total})",
+                )
+            ],
+        )
+
+    return BondColumns(**columns)
+
+
+def _normalize_weights(weights: np.ndarray) -> np.ndarray:
+    total_weight = weights.sum()
+    # The per-bond strategies raise ZeroDivisionError here, do the same
+    # rather than carrying NaN into the trades
+    if total_weight == 0 or not np.isfinite(weights).all():
+        raise ZeroDivisionError("float division by zero")
+    return weights / total_weight
+
+
+def _last_weight_per_id(
+    bond_id: np.ndarray, weights: np.ndarray, order: np.ndarray
+) -> np.ndarray:
+    """Give every row the weight of the last row visited with its bond_id.
+
+    The per-bond strategies key target weights by bond_id, so when ids
+    repeat the last bond visited wins for all of them.
+    """
+    visited = np.argsort(order, kind="stable")[::-1]
+    ids, last = np.unique(bond_id[visited], return_index=True)
+    return weights[visited[last]][np.searchsorted(ids, bond_id)]
+
+
+def calculate_target_weights_columns(
+    columns: BondColumns, request: RebalanceRequest, durations: np.ndarray
+) -> np.ndarray:
+    """Vectorized equivalent of the per-bond target weight strategies"""
+    order = np.arange(len(columns))
+
+    if request.strategy == RebalanceStrategy.EQUAL_WEIGHT:
+        return np.full(len(columns), 1.0 / len(columns))
+
+    if request.strategy == RebalanceStrategy.DURATION_TARGET:
+        if request.target_duration is None:
+            raise ValueError(
+                "Target duration is required for duration matching strategy"
+            )
+        distance = np.abs(durations - request.target_duration)
+        weights = _normalize_weights(1 / (1 + distance**2))
+
+    elif request.strategy == RebalanceStrategy.YIELD_OPTIMIZATION:
+        today = np.datetime64(datetime.now().date(), "D")
+        years_to_maturity = (columns.maturity_date - today).astype(np.float64) / 365
+        risk_factor = years_to_maturity / 10  # Simple risk proxy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = columns.yield_to_maturity / (1 + risk_factor)
+        weights = _normalize_weights(weights)
+
+    elif request.strategy == RebalanceStrategy.LADDERED:
+        maturity_years = columns.maturity_date.astype("datetime64[Y]")
+        _, first_seen, bucket, bucket_sizes = np.unique(
+            maturity_years, return_index=True, return_inverse=True, return_counts=True
+        )
+        weights = 1.0 / len(bucket_sizes) / bucket_sizes[bucket]
+        # Buckets are visited in order of first appearance, rows within each
+        bucket_rank = np.argsort(np.argsort(first_seen))
+        order = bucket_rank[bucket] * len(columns) + order
+
+    return _last_weight_per_id(columns.bond_id, weights, order)
+
+
+def calculate_trades_columns(columns: BondColumns, request: RebalanceRequest) -> tuple:
+    """Calculate the portfolio summary and trades for columnar input
+
+    Returns:
+        tuple: RebalanceSummary and a lazy iterator of trade dicts
+    """
+    total_value = request.total_value
+    if total_value is None:
+        total_value = float(np.dot(columns.quantity, columns.current_price))
+
+    durations = columns.duration
+    target_weight = calculate_target_weights_columns(columns, request, durations)
+    current_weight = columns.current_weight
+    ytm = columns.yield_to_maturity
+
+    # Same arithmetic as iter_trades so actions and total_trades agree
+    delta = target_weight * total_value - current_weight * total_value
+    amount = np.abs(delta)
+    quantity = (amount / columns.current_price).astype(np.int64)
+    action = np.where(delta > 0, "buy", np.where(delta < 0, "sell", "hold"))
+
+    summary = RebalanceSummary(
+        portfolio_id=request.portfolio_id,
         total_value=total_value,
-        strategy_used=payload.strategy,
-        total_trades=len(active_trades),
-        target_duration=payload.target_duration,
-        target_yield=payload.target_yield,
-        current_portfolio_duration=current_duration,
-        expected_portfolio_duration=expected_duration,
-        current_portfolio_yield=current_yield,
-        expected_portfolio_yield=expected_yield,
-        rebalancing_actions=trades,
+        strategy_used=request.strategy,
+        total_trades=int(np.count_nonzero(delta)),
+        target_duration=request.target_duration,
+        target_yield=request.target_yield,
+        current_portfolio_duration=float(np.dot(current_weight, durations)),
+        expected_portfolio_duration=float(np.dot(target_weight, durations)),
+        current_portfolio_yield=float(np.dot(current_weight, ytm)),
+        expected_portfolio_yield=float(np.dot(target_weight, ytm)),
     )
 
+    trades = (
+        {
+            "bond_id": bond_id,
+            "symbol": symbol,
+            "name": name,
+            "action": bond_action,
+            "quantity": bond_quantity,
+            "amount": bond_amount,
+            "current_weight": bond_current_weight,
+            "target_weight": bond_target_weight,
+            "expected_yield": expected_yield,
+            "expected_duration": expected_duration,
+        }
+        for (
+            bond_id,
+            symbol,
+            name,
+            bond_action,
+            bond_quantity,
+            bond_amount,
+            bond_current_weight,
+            bond_target_weight,
+            expected_yield,
+            expected_duration,
+        ) in zip(
+            columns.bond_id.tolist(),
+            columns.symbol,
+            columns.name,
+            action.tolist(),
+            quantity.tolist(),
+            amount.tolist(),
+            current_weight.tolist(),
+            target_weight.tolist(),
+            ytm.tolist(),
+            durations.tolist(),
+        )
+    )
+    return summary, trades
+
+
+# Documents the `stream=true` response alongside the RebalanceResult schema
+NDJSON_RESPONSE = {
+    200: {
+        "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        "description": "RebalanceResult, or a `header` record followed by "
+        "`trades` records when `stream=true`",
+    }
+}
 
-@app.post("/api/bond-rebalance", response_model=RebalanceResult)
-async def rebalance_bonds(payload: RebalanceBondPayload):
+
+@app.post(
+    "/api/bond-rebalance", response_model=RebalanceResult, responses=NDJSON_RESPONSE
+)
+async def rebalance_bonds(
+    payload: RebalanceBondPayload,
+    stream: bool = Query(False, description="Stream the result as NDJSON"),
+    chunk_size: int = Query(500, ge=1, le=10000),
+):
     """
     Rebalance a bond portfolio using the specified strategy
 
@@ -317,14 +891,74 @@ async def rebalance_bonds(payload: RebalanceBondPayload):
     - **Yield Optimization**: Maximizes expected yield while managing duration risk
     - **Tax Efficient**: Optimizes after-tax returns
     - **Laddered**: Creates a maturity ladder with equal allocation per maturity year
+
+    With `stream=true` the response is `application/x-ndjson`: a `header`
+    record with the portfolio metrics, then `trades` records of up to
+    `chunk_size` rebalancing actions each.
     """
     try:
+        if stream:
+            return StreamingResponse(
+                stream_trades(payload, chunk_size),
+                media_type="application/x-ndjson",
+            )
         result = calculate_trades(payload)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post(
+    "/api/bond-rebalance/columnar",
+    response_model=RebalanceResult,
+    responses=NDJSON_RESPONSE,
+)
+async def rebalance_bonds_columnar(
+    request: Request,
+    stream: bool = Query(False, description="Stream the result as NDJSON"),
+    chunk_size: int = Query(500, ge=1, le=10000),
+):
+    """
+    Opt-in fast path for very large portfolios, accepting the same body
+    and returning the same result as `/api/bond-rebalance`.
+
+    The `bonds` array is decoded straight into typed columns and
+    validated with vectorized checks, so no per-bond models are built.
+    Validation errors are reported per row as `["body", "bonds", row, field]`.
+    Values the fast casts cannot take (dates such as `2035-12-31T00:00:00`,
+    integers sent as `10.0`) fall back to pydantic per row. The one
+    difference from `BondAsset` is that integer fields must fit in int64.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=422, detail="Request body must be an object")
+
+    try:
+        rebalance_request = RebalanceRequest.parse_obj(
+            {key: value for key, value in body.items() if key != "bonds"}
+        )
+    except ValidationError as e:
+        errors = json.loads(e.json())
+        for error in errors:
+            error["loc"] = ["body", *error["loc"]]
+        raise HTTPException(status_code=422, detail=errors)
+    columns = parse_bond_columns(body.get("bonds"))
+
+    try:
+        summary, trades = calculate_trades_columns(columns, rebalance_request)
+        if stream:
+            return StreamingResponse(
+                _stream_records(summary, trades, chunk_size),
+                media_type="application/x-ndjson",
+            )
+        return JSONResponse({**summary.dict(), "rebalancing_actions": list(trades)})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/strategies")
 async def get_strategies():
     """Get available rebalancing strategies"""
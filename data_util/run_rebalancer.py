@@ -2,8 +2,16 @@ import requests
 import json
 from datetime import date, datetime, timedelta
 import random
-from data_util.bond_rebalancer import calculate_trades, RebalanceBondPayload
-from pydantic import parse_obj_as
+from data_util.bond_rebalancer import (
+    calculate_trades,
+    calculate_trades_columns,
+    parse_bond_columns,
+    RebalanceBondPayload,
+    RebalanceRequest,
+    RebalanceStrategy,
+)
+from fastapi import HTTPException
+from pydantic import ValidationError, parse_obj_as
 
 # If running the API locally
 API_URL = "http://localhost:8000/api/bond-rebalance"
@@ -64,6 +72,30 @@ def generate_sample_portfolio(num_bonds=5):
     return bonds
 
 
+def stream_rebalance_api(payload, chunk_size=500):
+    """Consume the NDJSON streaming mode, printing trades as they arrive"""
+    with requests.post(
+        API_URL,
+        params={"stream": "true", "chunk_size": chunk_size},
+        json=payload,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            record = json.loads(line)
+            if record["type"] == "header":
+                print(f"Total trades: {record['total_trades']}")
+                continue
+            for trade in record["rebalancing_actions"]:
+                if trade["action"] != "hold":
+                    print(
+                        f"{trade['action'].upper()} {trade['quantity']} of {trade['symbol']}: "
+                        + f"${trade['amount']:.2f}"
+                    )
+
+
 def test_rebalance_api():
     """Test the bond rebalance API with different strategies"""
     sample_bonds = generate_sample_portfolio(5)
@@ -120,6 +152,9 @@ def test_rebalance_api():
                     + f"Weight: {trade['current_weight']:.2%} → {trade['target_weight']:.2%}"
                 )
 
+        print("\nStreamed Trades:")
+        stream_rebalance_api(duration_payload, chunk_size=2)
+
     except requests.RequestException as e:
         print(f"API call failed: {e}")
 
@@ -149,5 +184,142 @@ def test_rebalance_api():
                 )
 
 
+def _assert_close(expected, actual, path="result"):
+    if isinstance(expected, float):
+        assert abs(expected - actual) <= 1e-9 * max(1, abs(expected)), path
+    elif isinstance(expected, dict):
+        assert expected.keys() == actual.keys(), path
+        for key in expected:
+            _assert_close(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert len(expected) == len(actual), path
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            _assert_close(e, a, f"{path}[{i}]")
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+
+def _rebalance_both_paths(payload):
+    """Run a payload through the model path and the columnar path"""
+    expected = calculate_trades(parse_obj_as(RebalanceBondPayload, payload))
+
+    request = RebalanceRequest.parse_obj(
+        {key: value for key, value in payload.items() if key != "bonds"}
+    )
+    summary, trades = calculate_trades_columns(
+        parse_bond_columns(payload["bonds"]), request
+    )
+    actual = {**summary.dict(), "rebalancing_actions": list(trades)}
+
+    return json.loads(expected.json()), json.loads(json.dumps(actual))
+
+
+def generate_edge_portfolio():
+    """Sample portfolio with the rows most likely to break vectorized math"""
+    today = date.today()
+    bonds = generate_sample_portfolio(12)
+
+    # Tiny and zero yields on 30-year monthly bonds
+    for bond, ytm in zip(bonds[:4], [0.0, 1e-12, 1e-9, 1e-7]):
+        bond["yield_to_maturity"] = ytm
+        bond["coupon_frequency"] = 12
+        bond["maturity_date"] = (today + timedelta(days=365 * 30)).isoformat()
+
+    # Already matured
+    bonds[4]["maturity_date"] = (today - timedelta(days=365)).isoformat()
+
+    # Repeated ids, the last bond visited with an id sets its target weight
+    bonds[5]["bond_id"] = bonds[6]["bond_id"]
+    bonds[7]["bond_id"] = bonds[6]["bond_id"]
+
+    # Beyond float64's exact integer range
+    bonds[8]["bond_id"] = 2**60 + 1
+
+    # Forms BondAsset accepts that are not plain YYYY-MM-DD or int
+    bonds[9]["maturity_date"] = f"{bonds[9]['maturity_date']}T00:00:00"
+    bonds[10]["quantity"] = float(bonds[10]["quantity"])
+    return bonds
+
+
+def test_columnar_parity(num_bonds=500):
+    """Check the columnar ingestion path against the pydantic model path"""
+    sample_bonds = generate_sample_portfolio(num_bonds)
+    for i, bond in enumerate(sample_bonds):
+        bond["coupon_frequency"] = [1, 2, 4, 12][i % 4]
+
+    portfolios = {"sample": sample_bonds, "edge": generate_edge_portfolio()}
+    for label, bonds in portfolios.items():
+        for strategy in RebalanceStrategy:
+            payload = {
+                "portfolio_id": "parity-portfolio",
+                "strategy": strategy.value,
+                "target_duration": 5.0,
+                "bonds": bonds,
+            }
+            expected, actual = _rebalance_both_paths(payload)
+            _assert_close(expected, actual)
+            print(f"{label} {strategy.value}: columnar result matches")
+
+    # No yield at all leaves nothing to normalize, both paths must refuse
+    flat_bonds = generate_sample_portfolio(3)
+    for bond in flat_bonds:
+        bond["yield_to_maturity"] = 0.0
+    payload = {
+        "portfolio_id": "parity-portfolio",
+        "strategy": "yield_optimization",
+        "bonds": flat_bonds,
+    }
+    for path in (
+        lambda: calculate_trades(parse_obj_as(RebalanceBondPayload, payload)),
+        lambda: calculate_trades_columns(
+            parse_bond_columns(flat_bonds), RebalanceRequest.parse_obj(payload)
+        ),
+    ):
+        try:
+            path()
+        except ZeroDivisionError:
+            pass
+        else:
+            raise AssertionError("zero yields: a path produced target weights")
+    print("zero yields: rejected by both paths")
+
+    invalid_rows = {
+        "missing field": lambda bond: bond.pop("symbol"),
+        "null date": lambda bond: bond.update(maturity_date=None),
+        "empty date": lambda bond: bond.update(maturity_date=""),
+        "NaT date": lambda bond: bond.update(maturity_date="NaT"),
+        "partial date": lambda bond: bond.update(maturity_date="2031"),
+        "list date": lambda bond: bond.update(maturity_date=["2031-01-01"]),
+        "list id": lambda bond: bond.update(bond_id=[1, 2]),
+        "float id beyond int64": lambda bond: bond.update(bond_id=1e30),
+        "fractional quantity": lambda bond: bond.update(quantity=1.5),
+        "weight out of range": lambda bond: bond.update(current_weight=2),
+        "non-positive price": lambda bond: bond.update(current_price=0),
+        "non-string symbol": lambda bond: bond.update(symbol=5),
+    }
+    for case, corrupt in invalid_rows.items():
+        bonds = [dict(bond) for bond in generate_sample_portfolio(5)]
+        corrupt(bonds[2])
+
+        try:
+            parse_obj_as(RebalanceBondPayload, {"portfolio_id": "p", "bonds": bonds})
+        except ValidationError:
+            pass
+        else:
+            raise AssertionError(f"{case}: model path accepted the payload")
+
+        try:
+            parse_bond_columns(bonds)
+        except HTTPException as e:
+            assert e.status_code == 422, case
+            assert any(
+                error["loc"][:3] == ["body", "bonds", 2] for error in e.detail
+            ), f"{case}: row 2 not reported in {e.detail}"
+        else:
+            raise AssertionError(f"{case}: columnar path accepted the payload")
+        print(f"{case}: rejected by both paths")
+
+
 if __name__ == "__main__":
+    test_columnar_parity()
     test_rebalance_api()